@@ -16,18 +16,23 @@ similarly versioned as the basic format.
 import glob
 import os
 import re
-from collections import OrderedDict
+import sys
 
 import numpy as np
 
 import aspecd.annotation
-import aspecd.infofile
-import aspecd.metadata
 import aspecd.io
 import aspecd.utils
 
 import cwepr.metadata
 import cwepr.exceptions
+import cwepr.utils
+
+_NUMBER_PATTERN = re.compile(r"[+-]?[0-9.]+([eE][+-]?[0-9]*)?")
+# Key-value lines, i.e. all lines not starting with "*", "#", or "."
+_DSC_PARAMETER_PATTERN = re.compile(
+    r"^(?![*#.])[ \t]*(\S+)[ \t]*([^\r\n]*)", re.MULTILINE
+)
 
 
 class BES3TImporter(aspecd.io.DatasetImporter):
@@ -42,19 +47,73 @@ class BES3TImporter(aspecd.io.DatasetImporter):
     This importer aims to take the parameters from the standard parameter
     layer if available, because it uses SI units and is documented.
 
+    Large data files (currently larger than 64 MiB) are memory-mapped
+    (copy-on-write) rather than read into memory, hence only those parts of
+    the data actually accessed are read from disk. Note that memory-mapped
+    data retain the byte order of the file, *i.e.* are not necessarily in
+    native byte order. Data read into memory are always converted to native
+    byte order. Whether to memory-map the data can be controlled by the
+    parameter ``memory_map``.
+
+    Parsed DSC files are kept in a :class:`cwepr.utils.ParsedFileCache`
+    shared by all instances, hence importing a dataset repeatedly parses
+    its DSC file only once.
+
+
+    Attributes
+    ----------
+    parameters : :class:`dict`
+        Additional parameters to control import options.
+
+        memory_map : :class:`bool` or :class:`str`
+            Whether to memory-map the data file rather than reading it.
+
+            Possible values are ``True``, ``False``, ``auto``
+
+            If set to ``auto``, only large data files get memory-mapped.
+
+            Default: ``auto``
+
+
+    Examples
+    --------
+    Usually, you will use the importer implicitly when cooking a recipe.
+    If you want to make sure the data are read into memory, *e.g.* as the
+    data file may change on disk while working with the dataset, you may
+    explicitly switch off memory-mapping:
+
+    .. code-block:: yaml
+
+        datasets:
+          - source: dataset
+            importer: BES3TImporter
+            importer_parameters:
+              memory_map: false
+
+
+    .. versionchanged:: 0.6
+        New parameter ``memory_map``
+
     """
 
+    _dsc_cache = cwepr.utils.ParsedFileCache()
+    # Byte order and number format as declared in the DSC file
+    _byte_orders = {"BIG": ">", "LIT": "<"}
+    _number_formats = {"C": "i1", "S": "i2", "I": "i4", "F": "f4", "D": "f8"}
+
     def __init__(self, source=None):
         super().__init__(source=source)
-        self._metadata_dict = OrderedDict()
+        self.parameters["memory_map"] = "auto"
+        self._metadata_dict = {}
         self.load_infofile = True
         # private properties
-        self._infofile = aspecd.infofile.Infofile()
+        self._infofile = cwepr.metadata.Infofile()
         self._dsc_dict = {}
         self._mapper_filename = "dsc_keys.yaml"
         self._is_two_dimensional = False
         self._dimensions = []
         self._file_encoding = ""
+        self._memory_map_threshold = 64 * 1024**2
 
     def _import(self):
         self._clean_filenames()
@@ -80,12 +139,26 @@ class BES3TImporter(aspecd.io.DatasetImporter):
 
     def _import_data(self):
         complete_filename = self.source + ".DTA"
-        raw_data = np.fromfile(complete_filename, dtype=self._file_encoding)
+        dtype = np.dtype(self._file_encoding)
+        if self._use_memory_map(complete_filename):
+            # Byte order is relabelled only, swapping happens on access.
+            # Plain array view, as memmap objects cannot be serialised.
+            raw_data = np.memmap(
+                complete_filename, dtype=dtype, mode="c"
+            ).view(np.ndarray)
+        else:
+            raw_data = cwepr.utils.read_binary_file(complete_filename, dtype)
         raw_data = np.reshape(raw_data, self._dimensions)
         if self._is_two_dimensional:
             raw_data = raw_data.T
         self.dataset.data.data = raw_data
 
+    def _use_memory_map(self, filename=""):
+        memory_map = self.parameters["memory_map"]
+        if str(memory_map).lower() == "auto":
+            return os.path.getsize(filename) > self._memory_map_threshold
+        return bool(memory_map)
+
     def _set_dataset_dimension(self):
         for key in ("YPTS", "XPTS"):
             if key in self._dsc_dict:
@@ -94,13 +167,18 @@ class BES3TImporter(aspecd.io.DatasetImporter):
             self._is_two_dimensional = True
 
     def _get_file_encoding(self):
-        encodings = {"BIG": ">f8", "LIT": "<f8"}
-        self._file_encoding = encodings[self._dsc_dict["BSEQ"]]
+        self._file_encoding = self._get_encoding(format_key="IRFMT")
+
+    def _get_encoding(self, format_key=""):
+        number_format = self._dsc_dict.get(format_key, "D")
+        return (
+            self._byte_orders[self._dsc_dict["BSEQ"]]
+            + self._number_formats[number_format]
+        )
 
     def _infofile_exists(self):
-        if self._get_infofile_name() and os.path.exists(
-            self._get_infofile_name()[0]
-        ):
+        infofile_name = self._get_infofile_name()
+        if infofile_name and os.path.exists(infofile_name[0]):
             return True
         print(
             f"No infofile found for dataset "
@@ -110,30 +188,34 @@ class BES3TImporter(aspecd.io.DatasetImporter):
         return False
 
     def _extract_metadata_from_dsc(self):
-        dsc_filename = self.source + ".DSC"
-        with open(dsc_filename, "r", encoding="ascii") as file:
-            lines = file.read().splitlines()
-
-        for line in lines:
-            if not (line.startswith(("*", "#", ".")) or line == ""):
-                if "'" in line:
-                    line = line.replace("'", "")
-                line = line.split(maxsplit=1)
-                key = line[0]
-                if len(line) > 1:
-                    value = line[1]
-                else:
-                    value = ""
-                if re.match(r"^[+-]?[0-9.]+([eE][+-]?[0-9]*)?$", value):
-                    value = float(value)
-                self._dsc_dict[key] = value
+        self._dsc_dict.update(
+            self._dsc_cache.get(self.source + ".DSC", self._parse_dsc_file)
+        )
+
+    @staticmethod
+    def _parse_dsc_file(filename=""):
+        # Decode once as a whole; latin-1 cannot fail on any byte
+        with open(filename, "rb") as file:
+            content = file.read().decode("latin-1").replace("'", "")
+        # Normalise line endings, as patterns only anchor after "\n"
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        dsc_dict = {}
+        for key, value in _DSC_PARAMETER_PATTERN.findall(content):
+            if _NUMBER_PATTERN.fullmatch(value):
+                value = float(value)
+            # Keys recur in every file, hence share them in the cache
+            dsc_dict[sys.intern(key)] = value
+        return dsc_dict
 
     def _map_dsc_into_dataset(self):
-        yaml_file = aspecd.utils.Yaml()
-        rootpath = os.path.split(os.path.abspath(__file__))[0]
-        yaml_file.read_from(os.path.join(rootpath, self._mapper_filename))
         dsc_metadata_dict = {}
-        dsc_metadata_dict = self._traverse(yaml_file.dict, dsc_metadata_dict)
+        dsc_metadata_dict = self._traverse(
+            cwepr.utils.read_yaml_file(
+                os.path.join(os.path.dirname(__file__), self._mapper_filename)
+            ),
+            dsc_metadata_dict,
+        )
         aspecd.utils.copy_keys_between_dicts(
             dsc_metadata_dict, self._metadata_dict
         )
@@ -160,8 +242,8 @@ class BES3TImporter(aspecd.io.DatasetImporter):
         self.dataset.data.axes[-1].quantity = "intensity"
 
         if self._is_two_dimensional:
-            self.dataset.data.axes[1].values = np.fromfile(
-                self.source + ".YGF", dtype=self._file_encoding
+            self.dataset.data.axes[1].values = cwepr.utils.read_binary_file(
+                self.source + ".YGF", dtype=self._get_encoding("YFMT")
             )
             self.dataset.data.axes[1].quantity = self._dsc_dict["YNAM"]
             self.dataset.data.axes[1].unit = self._dsc_dict["YUNI"]
@@ -201,7 +283,7 @@ class BES3TImporter(aspecd.io.DatasetImporter):
 
     def _map_metadata(self, infofile_version):
         """Bring the metadata into a unified format."""
-        mapper = aspecd.metadata.MetadataMapper()
+        mapper = cwepr.metadata.MetadataMapper()
         mapper.version = infofile_version
         mapper.metadata = self._infofile.parameters
         mapper.recipe_filename = "cwepr@metadata_mapper_cwepr.yaml"
@@ -161,17 +161,22 @@ Module documentation
 import glob
 import os
 import re
-from collections import OrderedDict
+import sys
 from datetime import datetime, timedelta
 
 import numpy as np
 
 import aspecd.io
-import aspecd.infofile
 import aspecd.annotation
-import aspecd.metadata
 import aspecd.utils
 
+import cwepr.metadata
+import cwepr.utils
+
+_NUMBER_PATTERN = re.compile(r"[+-]?[0-9.]+([eE][+-]?[0-9]*)?")
+# Key-value lines, with lines ending in "\r" (ESP) or "\n" (WinEPR)
+_PAR_PARAMETER_PATTERN = re.compile(r"(\S+)[^\S\r\n]*([^\r\n]*)")
+
 
 class BrukerESPWinEPRDefaultParameterValues:
     """
@@ -300,6 +305,9 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
     getting imported and the standard values overwritten by the differing
     values specified in the parameter file.
 
+    As with the DSC files of the BES3T format, parsed parameter files are
+    kept in a :class:`cwepr.utils.ParsedFileCache`.
+
 
     Attributes
     ----------
@@ -407,17 +415,22 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
     .. versionchanged:: 0.5.1
         Additional condition for WinEPR files; additional parameter ``format``
 
+    .. versionchanged:: 0.6
+        Cache parsed parameter files and mapping of parameters
+
     """
 
+    _par_cache = cwepr.utils.ParsedFileCache()
+
     def __init__(self, source=None):
         super().__init__(source=source)
         self.parameters["format"] = "auto"
         self.load_infofile = True
         # private properties
-        self._infofile = aspecd.infofile.Infofile()
+        self._infofile = cwepr.metadata.Infofile()
         self._par_dict = BrukerESPWinEPRDefaultParameterValues().parameters
         self._mapper_filename = "par_keys.yaml"
-        self._metadata_dict = OrderedDict()
+        self._metadata_dict = {}
         self._file_encoding = ""
 
     def _import(self):
@@ -451,25 +464,32 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
         self._metadata_dict = default_file.dict
 
     def _read_parameter_file(self):
-        par_filename = self.source + ".par"
-        with open(par_filename, "r", encoding="ascii") as file:
-            lines = file.read().splitlines()
-
-        for line in lines:
-            line = line.split(maxsplit=1)
-            key = line[0]
-            if len(line) > 1:
-                value = line[1]
-            else:
-                value = ""
-            if re.match(r"^[+-]?[0-9.]+([eE][+-]?[0-9]*)?$", value):
+        self._par_dict.update(
+            self._par_cache.get(
+                self.source + ".par", self._parse_parameter_file
+            )
+        )
+
+    @staticmethod
+    def _parse_parameter_file(filename=""):
+        # Decode once as a whole; latin-1 cannot fail on any byte
+        with open(filename, "rb") as file:
+            content = file.read().decode("latin-1")
+
+        par_dict = {}
+        for key, value in _PAR_PARAMETER_PATTERN.findall(content):
+            if _NUMBER_PATTERN.fullmatch(value):
                 value = float(value)
-            self._par_dict[key] = value
+            # Keys recur in every file, hence share them in the cache
+            par_dict[sys.intern(key)] = value
+        return par_dict
 
     def _import_data(self):
         complete_filename = self.source + ".spc"
         self._get_file_encoding()
-        raw_data = np.fromfile(complete_filename, self._file_encoding)
+        raw_data = cwepr.utils.read_binary_file(
+            complete_filename, self._file_encoding
+        )
         self.dataset.data.data = np.reshape(
             raw_data, (-1, int(self._par_dict["RES"]))
         ).T
@@ -491,9 +511,8 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
             self.parameters["format"] = "ESP"
 
     def _infofile_exists(self):
-        if self._get_infofile_name() and os.path.exists(
-            self._get_infofile_name()[0]
-        ):
+        infofile_name = self._get_infofile_name()
+        if infofile_name and os.path.exists(infofile_name[0]):
             return True
         print(
             f"No infofile found for dataset {os.path.split(self.source)[1]}, "
@@ -517,7 +536,7 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
 
     def _map_metadata(self, infofile_version):
         """Bring the metadata into a unified format."""
-        mapper = aspecd.metadata.MetadataMapper()
+        mapper = cwepr.metadata.MetadataMapper()
         mapper.version = infofile_version
         mapper.metadata = self._infofile.parameters
         mapper.recipe_filename = "cwepr@metadata_mapper_cwepr.yaml"
@@ -539,14 +558,13 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
         self._assign_comment_as_annotation()
 
     def _map_par_file(self):
-        yaml_file = aspecd.utils.Yaml()
-        yaml_file.read_stream(
-            aspecd.utils.get_package_data(
-                "cwepr@io/" + self._mapper_filename
-            ).encode()
-        )
         metadata_dict = {}
-        metadata_dict = self._traverse(yaml_file.dict, metadata_dict)
+        metadata_dict = self._traverse(
+            cwepr.utils.read_yaml_file(
+                os.path.join(os.path.dirname(__file__), self._mapper_filename)
+            ),
+            metadata_dict,
+        )
         # metadata_dict = self._check_if_temperature_empty(metadata_dict)
         aspecd.utils.copy_keys_between_dicts(
             metadata_dict, self._metadata_dict
@@ -560,8 +578,7 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
     @staticmethod
     def _check_if_temperature_empty(metadata_dict):
         if (
-            "value"
-            not in metadata_dict["temperature_control"]["temperature"].keys()
+            "value" not in metadata_dict["temperature_control"]["temperature"]
             or metadata_dict["temperature_control"]["temperature"]["value"]
             == 0
         ):
@@ -570,10 +587,10 @@ class ESPWinEPRImporter(aspecd.io.DatasetImporter):
 
     def _extract_datetime(self):
         start_date = self._try_parsing_date()
-        if "measurement" not in self._metadata_dict.keys():
+        if "measurement" not in self._metadata_dict:
             self._metadata_dict["measurement"] = {}
         self._metadata_dict["measurement"]["start"] = str(start_date)
-        if "end" not in self._metadata_dict["measurement"].keys():
+        if "end" not in self._metadata_dict["measurement"]:
             self._metadata_dict["measurement"]["end"] = str(
                 start_date + timedelta(minutes=1)
             )
@@ -20,9 +20,14 @@ referred to the aspecd-documentation (:mod:`aspecd.io`).
 
 If you want to export data to a txt-file, you might want to use the
 :class:`aspecd.io.TxtExporter`.
+
+Formatting numbers as text is comparably slow and results in large files.
+If you do not need a text file, but just want to store a dataset for
+later use, use the :class:`aspecd.io.AdfExporter` instead, storing
+numerical data in binary NumPy format together with all metadata and the
+history of the dataset.
 """
 
-import collections
 import datetime
 
 import numpy as np
@@ -54,19 +59,42 @@ class ASCIIExporter(aspecd.io.DatasetExporter):
                 - dataset1
                 - dataset2
 
+    Numbers are written with 17 significant digits, sufficient to recover
+    them exactly when reading the file, and without trailing zeros,
+    resulting in smaller files than the NumPy default. If you need a
+    different number format, set the attribute ``number_format``
+    accordingly.
+
+    Attributes
+    ----------
+    number_format : :class:`str`
+        Format used for writing the numeric data
+
+        See :func:`numpy.savetxt` for details.
+
+        Default: "%.17g"
+
+
+    .. versionchanged:: 0.6
+        New attribute ``number_format``, numbers written with "%.17g"
+        instead of "%.18e" by default
 
-    .. note::
-        Not tested.
     """
 
     def __init__(self):
         super().__init__()
+        self.number_format = "%.17g"
 
     def _export(self):
         """Export the dataset's numeric data and metadata."""
         file_name_data = self.target + ".txt"
         file_name_meta = self.target + ".yaml"
-        np.savetxt(file_name_data, self.dataset.data.data, delimiter=",")
+        np.savetxt(
+            file_name_data,
+            self.dataset.data.data,
+            delimiter=",",
+            fmt=self.number_format,
+        )
         metadata_writer = aspecd.utils.Yaml()
         metadata = self._get_and_prepare_metadata()
         metadata_writer.dict = metadata
@@ -109,8 +137,8 @@ class ASCIIExporter(aspecd.io.DatasetExporter):
         for key, value in dictionary.items():
             if isinstance(value, dict):
                 dictionary[key] = self._ndarrays_to_list_recursively(value)
-            if isinstance(value, np.ndarray):
-                dictionary[key].to_list()
+            elif isinstance(value, np.ndarray):
+                dictionary[key] = value.tolist()
         return dictionary
 
 
@@ -119,7 +147,7 @@ class MetadataExporter(aspecd.io.DatasetExporter):
 
     def __init__(self):
         super().__init__()
-        self.metadata_dict = collections.OrderedDict()
+        self.metadata_dict = {}
         self.filename = ""
 
     def _export(self):
@@ -140,7 +168,7 @@ class MetadataExporter(aspecd.io.DatasetExporter):
         yaml_file.write_to(self.filename)
 
     def _remove_empty_items_recursively(self, dict_=None):
-        tmp_dict = collections.OrderedDict()
+        tmp_dict = {}
         for key, value in dict_.items():
             if isinstance(value, dict):
                 dict_[key] = self._remove_empty_items_recursively(value)
@@ -44,20 +44,24 @@ class DatasetImporterFactory(aspecd.io.DatasetImporterFactory):
         name and different extension can reside next to each other and the
         correct one is taken into account.
 
+    .. versionchanged:: 0.6
+        :attr:`supported_formats` is a class attribute
+
     """
 
+    supported_formats = {
+        "BES3T": [".DTA", ".DSC"],
+        "ESPWinEPR": [".spc", ".par"],
+        "MagnettechXML": [".xml"],
+        "NIEHSDat": [".dat"],
+        "NIEHSLmb": [".lmb"],
+        "NIEHSExp": [".exp"],
+        "Txt": [".txt"],
+        "Csv": [".csv"],
+    }
+
     def __init__(self):
         super().__init__()
-        self.supported_formats = {
-            "BES3T": [".DTA", ".DSC"],
-            "ESPWinEPR": [".spc", ".par"],
-            "MagnettechXML": [".xml"],
-            "NIEHSDat": [".dat"],
-            "NIEHSLmb": [".lmb"],
-            "NIEHSExp": [".exp"],
-            "Txt": [".txt"],
-            "Csv": [".csv"],
-        }
         self.data_format = None
 
     def _get_importer(self):
@@ -81,21 +85,23 @@ class DatasetImporterFactory(aspecd.io.DatasetImporterFactory):
 
         """
         if os.path.isdir(self.source):
-            if self._directory_contains_gon_data():
+            # List directory only once for all the checks below
+            filenames = os.listdir(self.source)
+            if self._directory_contains_gon_data(filenames):
                 self.data_format = "GoniometerSweep"
                 importer = object_from_class_name(
                     "cwepr.io.GoniometerSweepImporter"
                 )
                 importer.source = self.source
                 return importer
-            if self._directory_contains_amplitude_sweep_data():
+            if self._directory_contains_amplitude_sweep_data(filenames):
                 self.data_format = "AmplitudeSweep"
                 importer = object_from_class_name(
                     "cwepr.io.AmplitudeSweepImporter"
                 )
                 importer.source = self.source
                 return importer
-            if self._directory_contains_power_sweep_data():
+            if self._directory_contains_power_sweep_data(filenames):
                 self.data_format = "PowerSweep"
                 importer = object_from_class_name(
                     "cwepr.io.PowerSweepImporter"
@@ -112,59 +118,42 @@ class DatasetImporterFactory(aspecd.io.DatasetImporterFactory):
 
     def _find_format(self):
         # detect extension
-        detected_format = None
         root, file_extension = os.path.splitext(self.source)
-        for file_format, extensions in self.supported_formats.items():
-            file_exists = []
-            if file_extension in extensions:
-                for extension in extensions:
-                    file_exists.append(os.path.isfile(root + extension))
-                if all(file_exists):
-                    detected_format = file_format
-            elif not file_extension:
-                for extension in extensions:
-                    file_exists.append(
-                        os.path.isfile(self.source + extension)
-                    )
-                if all(file_exists):
-                    detected_format = file_format
-        return detected_format
-
-    def _directory_contains_gon_data(self):
-        check_gon_filenames = []
-        if not os.listdir(self.source):
+        formats_for_extensions = {
+            extension: file_format
+            for file_format, extensions in self.supported_formats.items()
+            for extension in extensions
+        }
+        if file_extension in formats_for_extensions:
+            # Extensions are unique, hence only one format is possible
+            file_formats = [formats_for_extensions[file_extension]]
+        elif not file_extension:
+            # Later formats take precedence, hence search in reverse order
+            file_formats = reversed(list(self.supported_formats))
+        else:
+            return None
+        for file_format in file_formats:
+            if all(
+                os.path.isfile(root + extension)
+                for extension in self.supported_formats[file_format]
+            ):
+                return file_format
+        return None
+
+    @staticmethod
+    def _directory_contains_gon_data(filenames=None):
+        if not filenames:
             return False
-        for element in os.listdir(self.source):
-            if "gon" in element:
-                check_gon_filenames.append(True)
-            else:
-                check_gon_filenames.append(False)
-        if all(check_gon_filenames):
-            return True
-        return False
-
-    def _directory_contains_amplitude_sweep_data(self):
-        check_modamp_filenames = []
-        if not os.listdir(self.source):
+        return all("gon" in filename for filename in filenames)
+
+    @staticmethod
+    def _directory_contains_amplitude_sweep_data(filenames=None):
+        if not filenames:
             return False
-        for element in os.listdir(self.source):
-            if "mod" in element:
-                check_modamp_filenames.append(True)
-            else:
-                check_modamp_filenames.append(False)
-        if all(check_modamp_filenames):
-            return True
-        return False
-
-    def _directory_contains_power_sweep_data(self):
-        check_powersweep_filenames = []
-        if not os.listdir(self.source):
+        return all("mod" in filename for filename in filenames)
+
+    @staticmethod
+    def _directory_contains_power_sweep_data(filenames=None):
+        if not filenames:
             return False
-        for element in os.listdir(self.source):
-            if "pow" in element:
-                check_powersweep_filenames.append(True)
-            else:
-                check_powersweep_filenames.append(False)
-        if all(check_powersweep_filenames):
-            return True
-        return False
+        return all("pow" in filename for filename in filenames)
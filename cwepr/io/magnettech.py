@@ -44,9 +44,7 @@ import dateutil.parser
 import numpy as np
 
 import aspecd.annotation
-import aspecd.infofile
 import aspecd.io
-import aspecd.metadata
 import aspecd.processing
 
 import cwepr.dataset
@@ -94,14 +92,14 @@ class MagnettechXMLImporter(aspecd.io.DatasetImporter):
         self.parameters["data_curve_type"] = "MW_Absorption"
         self.parameters["axis_curve_type"] = "BField"
         # private properties
-        self._infofile = aspecd.infofile.Infofile()
+        self._infofile = cwepr.metadata.Infofile()
         self._data_curve = None
         self._axis_curve = None
         self._bfrom = float()
         self._bto = float()
         self._xvalues = None
         self._yvalues = None
-        self._infofile = aspecd.infofile.Infofile()
+        self._infofile = cwepr.metadata.Infofile()
 
     def _import(self):
         self._clean_up_filename()
@@ -170,14 +168,10 @@ class MagnettechXMLImporter(aspecd.io.DatasetImporter):
         mw_abs_x_slope = float(self._data_curve.attrib["XSlope"])
 
         mw_x = (
-            mw_abs_x_offset
-            + np.linspace(0, len(self._yvalues) - 1, num=len(self._yvalues))
-            * mw_abs_x_slope
+            mw_abs_x_offset + np.arange(len(self._yvalues)) * mw_abs_x_slope
         )
         b_field_x = (
-            b_field_x_offset
-            + np.linspace(0, len(self._xvalues) - 1, num=len(self._xvalues))
-            * b_field_x_slope
+            b_field_x_offset + np.arange(len(self._xvalues)) * b_field_x_slope
         )
         self._xvalues = np.interp(mw_x, b_field_x, self._xvalues)
 
@@ -224,9 +218,8 @@ class MagnettechXMLImporter(aspecd.io.DatasetImporter):
         self.dataset.data.axes[1].quantity = "intensity"
 
     def _infofile_exists(self):
-        if self._get_infofile_name() and os.path.exists(
-            self._get_infofile_name()[0]
-        ):
+        infofile_name = self._get_infofile_name()
+        if infofile_name and os.path.exists(infofile_name[0]):
             return True
         print(
             f"No infofile found for dataset {os.path.split(self.source)[1]},"
@@ -250,7 +243,7 @@ class MagnettechXMLImporter(aspecd.io.DatasetImporter):
 
     def _map_metadata(self, infofile_version):
         """Bring the metadata into a unified format."""
-        mapper = aspecd.metadata.MetadataMapper()
+        mapper = cwepr.metadata.MetadataMapper()
         mapper.version = infofile_version
         mapper.metadata = self._infofile.parameters
         mapper.recipe_filename = "cwepr@metadata_mapper_cwepr.yaml"
@@ -382,7 +375,7 @@ class GoniometerSweepImporter(aspecd.io.DatasetImporter):
         self.dataset = cwepr.dataset.ExperimentalDataset()
         self.filenames = None
         self.load_infofile = True
-        self._infofile = aspecd.infofile.Infofile()
+        self._infofile = cwepr.metadata.Infofile()
         self._data = None
         self._angles = []
 
@@ -403,8 +396,7 @@ class GoniometerSweepImporter(aspecd.io.DatasetImporter):
 
     def _sort_filenames(self):
         def sort_key(string=""):
-            num = string.split("gon_")[1]
-            num = num.split("dg")[0]
+            num = string.partition("gon_")[2].partition("dg")[0]
             return int(num)
 
         self.filenames = sorted(self.filenames, key=sort_key)
@@ -471,9 +463,8 @@ class GoniometerSweepImporter(aspecd.io.DatasetImporter):
             self._map_infofile()
 
     def _infofile_exists(self):
-        if self._get_infofile_name() and os.path.exists(
-            self._get_infofile_name()[0]
-        ):
+        infofile_name = self._get_infofile_name()
+        if infofile_name and os.path.exists(infofile_name[0]):
             return True
         print(
             f"No infofile found for dataset "
@@ -503,7 +494,7 @@ class GoniometerSweepImporter(aspecd.io.DatasetImporter):
 
     def _map_metadata(self, infofile_version):
         """Bring the metadata into a unified format."""
-        mapper = aspecd.metadata.MetadataMapper()
+        mapper = cwepr.metadata.MetadataMapper()
         mapper.version = infofile_version
         mapper.metadata = self._infofile.parameters
         mapper.recipe_filename = "cwepr@metadata_mapper_cwepr.yaml"
@@ -592,8 +583,7 @@ class AmplitudeSweepImporter(aspecd.io.DatasetImporter):
 
     def _sort_filenames(self):
         def sort_key(string=""):
-            num = string.split("mod_")[1]
-            num = num.split("mT")[0]
+            num = string.partition("mod_")[2].partition("mT")[0]
             return int(num)
 
         self.filenames = sorted(self.filenames, key=sort_key)
@@ -651,7 +641,6 @@ class AmplitudeSweepImporter(aspecd.io.DatasetImporter):
     def _import_collected_metadata(self):
         self._import_fixed_metadata()
         self._import_variable_metadata()
-        self._import_variable_metadata()
         self._import_date_time_metadata()
 
     def _import_fixed_metadata(self):
@@ -724,13 +713,13 @@ class AmplitudeSweepImporter(aspecd.io.DatasetImporter):
         self.dataset.metadata.probehead.coupling = "critical"
 
     def _import_variable_metadata(self):
-        temperatures = []
-        qfactors = []
-        for _, dataset_ in enumerate(self._data):
-            temperatures.append(
-                dataset_.metadata.temperature_control.temperature.value
-            )
-            qfactors.append(dataset_.metadata.bridge.q_value)
+        temperatures = [
+            dataset_.metadata.temperature_control.temperature.value
+            for dataset_ in self._data
+        ]
+        qfactors = [
+            dataset_.metadata.bridge.q_value for dataset_ in self._data
+        ]
         temperature = self._average_and_check_for_deviation(temperatures)
         qfactor = self._average_and_check_for_deviation(qfactors)
 
@@ -757,11 +746,10 @@ class AmplitudeSweepImporter(aspecd.io.DatasetImporter):
         return value
 
     def _import_date_time_metadata(self):
-        starts = []
-        ends = []
-        for _, dataset_ in enumerate(self._data):
-            starts.append(dataset_.metadata.measurement.start)
-            ends.append(dataset_.metadata.measurement.end)
+        starts = [
+            dataset_.metadata.measurement.start for dataset_ in self._data
+        ]
+        ends = [dataset_.metadata.measurement.end for dataset_ in self._data]
 
         self.dataset.metadata.measurement.start = min(starts).strftime(
             "%Y-%m-%d %H:%M:%S"
@@ -831,8 +819,7 @@ class PowerSweepImporter(aspecd.io.DatasetImporter):
 
     def _sort_filenames(self):
         def sort_key(string=""):
-            num = string.split("pow_")[1]
-            num = num.split("mW")[0]
+            num = string.partition("pow_")[2].partition("mW")[0]
             return int(num)
 
         self.filenames = sorted(self.filenames, key=sort_key)
@@ -885,7 +872,6 @@ class PowerSweepImporter(aspecd.io.DatasetImporter):
     def _import_collected_metadata(self):
         self._import_fixed_metadata()
         self._import_variable_metadata()
-        self._import_variable_metadata()
         self._import_date_time_metadata()
 
     def _import_fixed_metadata(self):
@@ -956,13 +942,13 @@ class PowerSweepImporter(aspecd.io.DatasetImporter):
         self.dataset.metadata.probehead.coupling = "critical"
 
     def _import_variable_metadata(self):
-        temperatures = []
-        qfactors = []
-        for _, dataset_ in enumerate(self._data):
-            temperatures.append(
-                dataset_.metadata.temperature_control.temperature.value
-            )
-            qfactors.append(dataset_.metadata.bridge.q_value)
+        temperatures = [
+            dataset_.metadata.temperature_control.temperature.value
+            for dataset_ in self._data
+        ]
+        qfactors = [
+            dataset_.metadata.bridge.q_value for dataset_ in self._data
+        ]
         temperature = self._average_and_check_for_deviation(temperatures)
         qfactor = self._average_and_check_for_deviation(qfactors)
 
@@ -989,11 +975,10 @@ class PowerSweepImporter(aspecd.io.DatasetImporter):
         return value
 
     def _import_date_time_metadata(self):
-        starts = []
-        ends = []
-        for _, dataset_ in enumerate(self._data):
-            starts.append(dataset_.metadata.measurement.start)
-            ends.append(dataset_.metadata.measurement.end)
+        starts = [
+            dataset_.metadata.measurement.start for dataset_ in self._data
+        ]
+        ends = [dataset_.metadata.measurement.end for dataset_ in self._data]
 
         self.dataset.metadata.measurement.start = min(starts).strftime(
             "%Y-%m-%d %H:%M:%S"
@@ -387,13 +387,18 @@ Module documentation
 """
 
 import io
-import struct
+import re
 
 import numpy as np
 
 import aspecd.io
 import aspecd.annotation
 
+# Non-empty lines, without trailing whitespace
+_HEADER_LINE_PATTERN = re.compile(r"^(?=.)(.*?)[^\S\n]*$", re.MULTILINE)
+# Line separating header and data, possibly being the very first line
+_DATA_MARKER_PATTERN = re.compile(r"^\[DATA\]$", re.MULTILINE)
+
 
 class NIEHSDatImporter(aspecd.io.DatasetImporter):
     """
@@ -535,17 +540,9 @@ class NIEHSLmbImporter(aspecd.io.DatasetImporter):
         self._file_format = self._file_contents[:4].decode("utf-8")
 
     def _read_and_assign_parameters(self):
-        parameters = []
         self._position = 4
         max_par = 20
-        for _ in range(max_par):
-            parameters.append(
-                struct.unpack(
-                    "f",
-                    self._file_contents[self._position : self._position + 4],
-                )[0]
-            )
-            self._position += 4
+        parameters = self._read_floats(count=max_par)
         # Note: Only assign those parameters necessary in the given context
         self._parameters = {
             "sweep_width": parameters[0] / 10,
@@ -555,55 +552,41 @@ class NIEHSLmbImporter(aspecd.io.DatasetImporter):
         }
 
     def _read_data(self):
-        data = []
-        for _ in range(int(self._parameters["n_points"])):
-            data.append(
-                struct.unpack(
-                    "f",
-                    self._file_contents[self._position : self._position + 4],
-                )[0]
-            )
-            self._position += 4
-        self.dataset.data.data = np.asarray(data)
+        self.dataset.data.data = self._read_floats(
+            count=int(self._parameters["n_points"])
+        )
 
-    # noinspection GrazieInspection
-    def _read_comments_and_metadata(self):
-        comment_size = 60
-        self._comment = [
-            self._file_contents[
-                self._position : self._position + comment_size
-            ]
+    def _read_floats(self, count=0):
+        # Single-precision floats in file, converted to double precision
+        values = np.frombuffer(
+            self._file_contents, dtype="f", count=count, offset=self._position
+        ).astype(float)
+        self._position += 4 * count
+        return values
+
+    def _read_strings(self, count=1, size=0):
+        # Fields of fixed width, padded with null bytes
+        block = self._file_contents[
+            self._position : self._position + count * size
+        ]
+        self._position += count * size
+        return [
+            block[offset : offset + size]
             .decode("utf-8")
             .replace("\x00", "")
             .strip()
+            for offset in range(0, count * size, size)
         ]
-        self._position += comment_size
-
-        str_num = 20
-        str_size = 12
-        strings = []
-        for _ in range(str_num):
-            strings.append(
-                self._file_contents[
-                    self._position : self._position + str_size
-                ]
-                .decode("utf-8")
-                .replace("\x00", "")
-                .strip()
-            )
-            self._position += str_size
 
+    # noinspection GrazieInspection
+    def _read_comments_and_metadata(self):
+        comment_size = 60
+        self._comment = self._read_strings(size=comment_size)
+        strings = self._read_strings(count=20, size=12)
         if self._file_format == "ESR2":
-            for _ in range(2):
-                self._comment.append(
-                    self._file_contents[
-                        self._position : self._position + comment_size
-                    ]
-                    .decode("utf-8")
-                    .replace("\x00", "")
-                    .strip()
-                )
-                self._position += comment_size
+            self._comment.extend(
+                self._read_strings(count=2, size=comment_size)
+            )
 
         # Only those metadata of interest are mapped
         # Note: The first nine parameters are input MANUALLY, never trust em.
@@ -688,7 +671,6 @@ class NIEHSExpImporter(aspecd.io.DatasetImporter):
     def __init__(self, source=None):
         super().__init__(source=source)
         self._file_contents = None
-        self._lines = None
         self._file_format = None
         self._raw_data = None
         self._header = None
@@ -710,22 +692,24 @@ class NIEHSExpImporter(aspecd.io.DatasetImporter):
         filename = self.source + ".exp"
         with open(filename, "r", encoding="ascii") as file:
             self._file_contents = file.read()
-        self._lines = self._file_contents.splitlines()
 
     def _detect_file_format(self):
-        if self._lines[0].startswith("["):
+        if self._file_contents.startswith("["):
             self._file_format = "with_blocks"
         else:
             self._file_format = "DSV"
 
     def _import_data(self):
         if self._file_format == "with_blocks":
+            # Only the header needs to be split into lines
+            marker = _DATA_MARKER_PATTERN.search(self._file_contents)
             # noinspection PyTypeChecker
             self._raw_data = np.loadtxt(
-                io.StringIO(self._file_contents),
-                skiprows=self._lines.index("[DATA]") + 1,
+                io.StringIO(self._file_contents[marker.end() :])
+            )
+            self._header = _HEADER_LINE_PATTERN.findall(
+                self._file_contents[: marker.start()]
             )
-            self._header = self._lines[: self._lines.index("[DATA]")]
         else:
             # noinspection PyTypeChecker
             self._raw_data = np.loadtxt(io.StringIO(self._file_contents))
@@ -737,10 +721,6 @@ class NIEHSExpImporter(aspecd.io.DatasetImporter):
 
     def _assign_comment(self):
         if self._header:
-            # Remove empty lines and trailing spaces
-            self._header = [
-                element.rstrip() for element in self._header if element != ""
-            ]
             comment_annotation = aspecd.annotation.Comment()
             comment_annotation.comment = self._header
             self.dataset.annotate(comment_annotation)
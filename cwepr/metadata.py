@@ -23,15 +23,26 @@ For an overview of the structures of the dataset classes and their
 corresponding metadata, see the :doc:`dataset structure </dataset-structure>`
 section.
 
+Mapping metadata from infofiles to the metadata structure of the datasets
+is done by the importers using the
+:class:`cwepr.metadata.MetadataMapper` class that caches the mappings
+read from the mapping recipe file. Similarly, the infofiles themselves are
+read using the :class:`cwepr.metadata.Infofile` class that caches their
+parsed contents.
+
 
 Module documentation
 ====================
 
 """
 
+import copy
+
+import aspecd.infofile
 import aspecd.metadata
 import aspecd.utils
 
+import cwepr.utils
 from cwepr.exceptions import UnequalUnitsError
 
 
@@ -656,3 +667,84 @@ class TemperatureControl(aspecd.metadata.TemperatureControl):
         self.cryostat = ""
         self.cryogen = ""
         super().__init__(dict_=dict_)
+
+
+class MetadataMapper(aspecd.metadata.MetadataMapper):
+    """Metadata mapper caching the mappings created from recipe files.
+
+    Creating the mappings from a recipe file involves reading and parsing
+    the YAML file each time :meth:`map` is called. As all importers use the
+    same recipe file for a given infofile version, the mappings created are
+    cached on the class level and reused, keyed by recipe filename and
+    version.
+
+    As this class inherits from :class:`aspecd.metadata.MetadataMapper`,
+    see the documentation of the parent class for details.
+
+    .. versionadded:: 0.6
+
+    """
+
+    _mappings_cache = {}
+
+    def create_mappings(self):
+        """
+        Create mappings from mapping recipe stored in YAML file.
+
+        If mappings for the given combination of recipe filename and
+        version have been created before, they are taken from the cache
+        rather than reading the recipe file again.
+
+        See :meth:`aspecd.metadata.MetadataMapper.create_mappings` for
+        details of the mapping recipes.
+
+        """
+        key = (self.recipe_filename, self.version)
+        if key not in self._mappings_cache:
+            mappings = self.mappings
+            self.mappings = []
+            super().create_mappings()
+            self._mappings_cache[key] = self.mappings
+            self.mappings = mappings
+        self.mappings.extend(self._mappings_cache[key])
+
+
+class Infofile(aspecd.infofile.Infofile):
+    """Infofile caching the contents parsed from files.
+
+    Recipes often import the same datasets repeatedly, and with them their
+    infofiles. Hence, the contents parsed from infofiles are kept in a
+    :class:`cwepr.utils.ParsedFileCache` shared by all instances.
+
+    As this class inherits from :class:`aspecd.infofile.Infofile`,
+    see the documentation of the parent class for details.
+
+    .. versionadded:: 0.6
+
+    """
+
+    _contents_cache = cwepr.utils.ParsedFileCache()
+
+    def parse(self):
+        """Parse info file.
+
+        If the file has been parsed before and not been changed since,
+        its contents are taken from the cache rather than parsing the file
+        again. As the parameters are usually modified afterwards, *e.g.*
+        by a :class:`MetadataMapper`, a copy of the cached contents is used.
+
+        See :meth:`aspecd.infofile.Infofile.parse` for details.
+
+        """
+        try:
+            contents = self._contents_cache.get(self.filename, self._parse)
+        except (TypeError, OSError):
+            super().parse()
+            return
+        self.parameters, self.infofile_info = copy.deepcopy(contents)
+
+    @staticmethod
+    def _parse(filename=""):
+        infofile = aspecd.infofile.Infofile(filename=filename)
+        infofile.parse()
+        return infofile.parameters, infofile.infofile_info
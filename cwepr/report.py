@@ -64,7 +64,6 @@ Module documentation
 
 """
 
-import collections
 import copy
 import os
 
@@ -82,7 +81,7 @@ class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
         self.dataset = cwepr.dataset.ExperimentalDataset()
         # private properties
         self._metadata = {}
-        self._tasks = collections.OrderedDict()
+        self._tasks = {}
         self._figure_name = {}
         self._exclude_from_to_dict.extend(["dataset"])
 
@@ -97,7 +96,7 @@ class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
 
     def _prepare_metadata(self):
         self._metadata = self.context["dataset"]["metadata"]
-        self._metadata["parameter"] = collections.OrderedDict()
+        self._metadata["parameter"] = {}
         self._collect_experimental_parameters()
 
     def _collect_experimental_parameters(self):
@@ -163,7 +162,7 @@ class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
         for key, value in dict_.items():
             if key == "dataset":
                 continue
-            if isinstance(value, (collections.OrderedDict, dict)):
+            if isinstance(value, dict):
                 tmp_dict[key] = self._sanitise_context(value)
             elif not value:
                 tmp_dict.pop(key)
@@ -222,7 +221,7 @@ class PowerSweepAnalysisReporter(aspecd.report.LaTeXReporter):
 
     def _prepare_metadata(self):
         self._metadata = self.context["dataset"]["metadata"]
-        self._metadata["parameter"] = collections.OrderedDict()
+        self._metadata["parameter"] = {}
         self._collect_experimental_parameters()
 
     def _collect_experimental_parameters(self):
@@ -258,7 +257,7 @@ class PowerSweepAnalysisReporter(aspecd.report.LaTeXReporter):
         for key, value in dict_.items():
             if key == "dataset":
                 continue
-            if isinstance(value, (collections.OrderedDict, dict)):
+            if isinstance(value, dict):
                 tmp_dict[key] = self._sanitise_context(value)
             elif not value:
                 tmp_dict.pop(key)
@@ -304,7 +303,7 @@ class DokuwikiCaptionsReporter(aspecd.report.Reporter):
 
     def _prepare_metadata(self):
         self._metadata = self.context["dataset"]["metadata"]
-        self._metadata["parameter"] = collections.OrderedDict()
+        self._metadata["parameter"] = {}
         self._collect_experimental_parameters()
 
     def _collect_experimental_parameters(self):
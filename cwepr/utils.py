@@ -8,9 +8,17 @@ modules of the cwepr package, but it can be imported into every other module.
 
 """
 
+import os
+
 import numpy as np
 import scipy.constants
 
+import aspecd.utils
+
+_PLANCK_CONSTANT = scipy.constants.value("Planck constant")
+_BOHR_MAGNETON = scipy.constants.value("Bohr magneton")
+_FLOAT_RESOLUTION = np.finfo(np.float64).resolution
+
 
 def convert_g2mT(values, mw_freq=None):  # noqa
     """
@@ -36,11 +44,10 @@ def convert_g2mT(values, mw_freq=None):  # noqa
         converted values in millitesla (mT)
 
     """
-    planck_constant = scipy.constants.value("Planck constant")
-    mu_b = scipy.constants.value("Bohr magneton")
-
-    values = np.asarray([not_zero(value) for value in values])
-    return (planck_constant * mw_freq * 1e9) / (mu_b * values * 1e-3)
+    values = not_zero(np.asarray(values))
+    return (_PLANCK_CONSTANT * mw_freq * 1e9) / (
+        _BOHR_MAGNETON * values * 1e-3
+    )
 
 
 def convert_mT2g(values, mw_freq=None):  # noqa
@@ -67,11 +74,10 @@ def convert_mT2g(values, mw_freq=None):  # noqa
         converted values in *g*
 
     """
-    planck_constant = scipy.constants.value("Planck constant")
-    mu_b = scipy.constants.value("Bohr magneton")
-
-    values = np.asarray([not_zero(value) for value in values])
-    return (planck_constant * mw_freq * 1e9) / (mu_b * values * 1e-3)
+    values = not_zero(np.asarray(values))
+    return (_PLANCK_CONSTANT * mw_freq * 1e9) / (
+        _BOHR_MAGNETON * values * 1e-3
+    )
 
 
 def not_zero(value):
@@ -92,15 +98,182 @@ def not_zero(value):
 
     Parameters
     ----------
-    value : :class:`float`
+    value : :class:`float` | :class:`numpy.ndarray`
         Value that can become (too close to) zero to trigger NaN values
 
     Returns
     -------
-    value : :class:`float`
+    value : :class:`float` | :class:`numpy.ndarray`
         Value guaranteed not to be zero
 
+
+    .. versionchanged:: 0.6
+        Works on arrays as well, operating element-wise
+
     """
-    return np.copysign(
-        max(abs(value), np.finfo(np.float64).resolution), value
-    )
+    return np.copysign(np.maximum(np.abs(value), _FLOAT_RESOLUTION), value)
+
+
+class ParsedFileCache:
+    """
+    Cache for contents parsed from files, keeping the most recent ones.
+
+    Importing the same dataset repeatedly, *e.g.* in recipes, parses the
+    same files over and over again. Hence, importers keep the contents
+    parsed from files in a cache, together with the modification time and
+    size of the respective file, and reuse them as long as both are
+    unchanged. Note that changes within the timestamp resolution of the
+    file system that leave the size of a file unchanged go unnoticed.
+
+    Only the contents of the :attr:`maxsize` files used most recently are
+    kept. As the cached contents are handed out to every caller, they must
+    not be modified.
+
+    Attributes
+    ----------
+    maxsize : :class:`int`
+        Maximum number of files whose contents are kept
+
+        Default: 64
+
+    Examples
+    --------
+    Usually, an importer keeps a cache on the class level and provides a
+    function or method parsing a file given its name:
+
+    .. code-block:: python
+
+        class MyImporter(aspecd.io.DatasetImporter):
+
+            _cache = cwepr.utils.ParsedFileCache()
+
+            def _import(self):
+                contents = self._cache.get(self.source, self._parse_file)
+
+
+    .. versionadded:: 0.6
+
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._entries = {}
+
+    def __contains__(self, filename):
+        return os.path.abspath(filename) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, filename="", parser=None):
+        """
+        Get the contents of a file, parsing it only if necessary.
+
+        Parameters
+        ----------
+        filename : :class:`str`
+            Name of the file
+
+        parser : :class:`callable`
+            Function parsing the file, called with the absolute filename
+
+        Returns
+        -------
+        contents
+            Contents parsed from the file
+
+        Raises
+        ------
+        OSError
+            Raised if the file cannot be accessed
+
+        """
+        filename = os.path.abspath(filename)
+        file_stats = os.stat(filename)
+        signature = (file_stats.st_mtime_ns, file_stats.st_size)
+        # Removing and reinserting entries keeps them in order of their use
+        entry = self._entries.pop(filename, None)
+        if not entry or entry[0] != signature:
+            entry = (signature, parser(filename))
+        self._entries[filename] = entry
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        return entry[1]
+
+    def clear(self):
+        """Remove the contents of all files from the cache."""
+        self._entries.clear()
+
+
+_YAML_FILE_CACHE = ParsedFileCache()
+
+
+def read_binary_file(filename="", dtype=None):
+    """
+    Read numeric data from a binary file, converting to native byte order.
+
+    The data are read into a preallocated array, hence without any
+    intermediate copy. Data stored in non-native byte order are swapped in
+    place once, rather than in every subsequent operation.
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        Name of the file
+
+    dtype : :class:`numpy.dtype` | :class:`str`
+        Data type of the values stored in the file, including byte order
+
+    Returns
+    -------
+    data : :class:`numpy.ndarray`
+        One-dimensional array with the data read from the file
+
+    Raises
+    ------
+    EOFError
+        Raised if the file could not be read completely
+
+
+    .. versionadded:: 0.6
+
+    """
+    dtype = np.dtype(dtype)
+    data = np.empty(os.path.getsize(filename) // dtype.itemsize, dtype)
+    with open(filename, "rb") as file:
+        if file.readinto(data) != data.nbytes:
+            raise EOFError(f"Could not read file {filename} completely")
+    if not dtype.isnative:
+        data = data.byteswap(inplace=True).view(dtype.newbyteorder("="))
+    return data
+
+
+def read_yaml_file(filename=""):
+    """
+    Read a YAML file, parsing it only if necessary.
+
+    Files such as the tables mapping parameters of file formats to the
+    metadata of a dataset are read by each import. Hence, their contents
+    are kept in a :class:`ParsedFileCache` and must not be modified.
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        Name of the file
+
+    Returns
+    -------
+    contents : :class:`dict`
+        Contents of the YAML file
+
+
+    .. versionadded:: 0.6
+
+    """
+    return _YAML_FILE_CACHE.get(filename, _parse_yaml_file)
+
+
+def _parse_yaml_file(filename=""):
+    yaml_file = aspecd.utils.Yaml()
+    yaml_file.read_from(filename)
+    return yaml_file.dict
@@ -1,7 +1,13 @@
+import mmap
 import os
 import shutil
+import sys
 import tempfile
 import unittest
+from unittest import mock
+
+import aspecd.io
+import numpy as np
 
 import cwepr.dataset
 import cwepr.io
@@ -9,9 +15,19 @@ import cwepr.io
 ROOTPATH = os.path.split(os.path.abspath(__file__))[0]
 
 
+def is_memory_mapped(array):
+    while isinstance(array, np.ndarray):
+        array = array.base
+    return isinstance(array, mmap.mmap)
+
+
 class TestBES3TImporter(unittest.TestCase):
     def setUp(self):
         self.dataset = cwepr.dataset.ExperimentalDataset()
+        cwepr.io.bes3t.BES3TImporter._dsc_cache.clear()
+
+    def tearDown(self):
+        cwepr.io.bes3t.BES3TImporter._dsc_cache.clear()
 
     def test_import_with_1D_dataset(self):
         source = os.path.join(
@@ -112,3 +128,112 @@ class TestBES3TImporter(unittest.TestCase):
         self.assertEqual(
             self.dataset.metadata.signal_channel.time_constant.unit, "ms"
         )
+
+    def test_file_encoding_uses_byte_order_and_format_from_dsc(self):
+        importer = cwepr.io.bes3t.BES3TImporter()
+        importer._dsc_dict = {"BSEQ": "LIT", "IRFMT": "F"}
+        importer._get_file_encoding()
+        self.assertEqual("<f4", importer._file_encoding)
+
+    def test_import_converts_data_to_native_byte_order(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        importer = cwepr.io.bes3t.BES3TImporter(source=source)
+        self.dataset.import_from(importer)
+        self.assertTrue(self.dataset.data.data.dtype.isnative)
+
+    def test_import_parses_dsc_file_only_once(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        with mock.patch.object(
+            cwepr.io.bes3t.BES3TImporter,
+            "_parse_dsc_file",
+            wraps=cwepr.io.bes3t.BES3TImporter._parse_dsc_file,
+        ) as parse_dsc_file:
+            for _ in range(2):
+                importer = cwepr.io.bes3t.BES3TImporter(source=source)
+                cwepr.dataset.ExperimentalDataset().import_from(importer)
+        parse_dsc_file.assert_called_once()
+        self.assertEqual("BIG", importer._dsc_dict["BSEQ"])
+
+    def test_import_reparses_changed_dsc_file(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        with tempfile.TemporaryDirectory() as testdir:
+            new_source = os.path.join(testdir, "test")
+            for extension in (".DSC", ".DTA"):
+                shutil.copyfile(source + extension, new_source + extension)
+            importer = cwepr.io.bes3t.BES3TImporter(source=new_source)
+            importer._extract_metadata_from_dsc()
+            with open(new_source + ".DSC", "a", encoding="ascii") as file:
+                file.write("FOO\tbar\n")
+            importer = cwepr.io.bes3t.BES3TImporter(source=new_source)
+            importer._extract_metadata_from_dsc()
+            self.assertEqual("bar", importer._dsc_dict["FOO"])
+
+    def test_import_dsc_file_with_carriage_return_line_endings(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        with tempfile.TemporaryDirectory() as testdir:
+            new_source = os.path.join(testdir, "test")
+            with open(source + ".DSC", "rb") as file:
+                dsc = file.read().replace(b"\r\n", b"\n")
+            with open(new_source + ".DSC", "wb") as file:
+                file.write(dsc.replace(b"\n", b"\r"))
+            shutil.copyfile(source + ".DTA", new_source + ".DTA")
+            importer = cwepr.io.bes3t.BES3TImporter(source=new_source)
+            self.dataset.import_from(importer)
+        self.assertEqual(
+            cwepr.io.bes3t.BES3TImporter._parse_dsc_file(source + ".DSC"),
+            importer._dsc_dict,
+        )
+
+    @unittest.skipIf(sys.byteorder != "little", "needs little endian host")
+    def test_import_memory_maps_large_files_with_native_byte_order(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        with tempfile.TemporaryDirectory() as testdir:
+            new_source = os.path.join(testdir, "test")
+            with open(source + ".DSC", encoding="ascii") as file:
+                dsc = file.read().replace("BSEQ\tBIG", "BSEQ\tLIT")
+            with open(new_source + ".DSC", "w", encoding="ascii") as file:
+                file.write(dsc)
+            data = np.fromfile(source + ".DTA", dtype=">f8")
+            data.astype("<f8").tofile(new_source + ".DTA")
+            importer = cwepr.io.bes3t.BES3TImporter(source=new_source)
+            importer._memory_map_threshold = 0
+            self.dataset.import_from(importer)
+            self.assertTrue(is_memory_mapped(self.dataset.data.data))
+            np.testing.assert_array_equal(data, self.dataset.data.data)
+
+    def test_import_with_memory_map_parameter_memory_maps_data(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        importer = cwepr.io.bes3t.BES3TImporter(source=source)
+        importer.parameters["memory_map"] = True
+        self.dataset.import_from(importer)
+        self.assertTrue(is_memory_mapped(self.dataset.data.data))
+
+    def test_import_without_memory_map_parameter_reads_data(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        importer = cwepr.io.bes3t.BES3TImporter(source=source)
+        importer.parameters["memory_map"] = False
+        importer._memory_map_threshold = 0
+        self.dataset.import_from(importer)
+        self.assertFalse(is_memory_mapped(self.dataset.data.data))
+
+    def test_import_memory_maps_large_files_keeping_byte_order(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        importer = cwepr.io.bes3t.BES3TImporter(source=source)
+        importer._memory_map_threshold = 0
+        self.dataset.import_from(importer)
+        self.assertTrue(is_memory_mapped(self.dataset.data.data))
+        self.assertEqual(">f8", self.dataset.data.data.dtype.str)
+        np.testing.assert_array_equal(
+            np.fromfile(source + ".DTA", dtype=">f8"), self.dataset.data.data
+        )
+
+    def test_export_memory_mapped_dataset(self):
+        source = os.path.join(ROOTPATH, "testdata/BDPA-1DFieldSweep")
+        importer = cwepr.io.bes3t.BES3TImporter(source=source)
+        importer.parameters["memory_map"] = True
+        self.dataset.import_from(importer)
+        with tempfile.TemporaryDirectory() as testdir:
+            exporter = aspecd.io.AdfExporter()
+            exporter.target = os.path.join(testdir, "test")
+            self.dataset.export_to(exporter)
+            self.assertTrue(os.path.exists(exporter.target + ".adf"))
@@ -1,7 +1,10 @@
 import datetime
 import os
+import shutil
 import struct
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -25,8 +28,10 @@ class TestESPWinEPRImporter(unittest.TestCase):
         self.source = os.path.join(ROOTPATH, "testdata/winepr.par")
         self.par_filename = "delete_me.par"
         self.spc_filename = "delete_me.spc"
+        cwepr.io.esp_winepr.ESPWinEPRImporter._par_cache.clear()
 
     def tearDown(self):
+        cwepr.io.esp_winepr.ESPWinEPRImporter._par_cache.clear()
         if os.path.exists(self.par_filename):
             os.remove(self.par_filename)
         if os.path.exists(self.spc_filename):
@@ -67,6 +72,16 @@ class TestESPWinEPRImporter(unittest.TestCase):
         self.dataset.import_from(importer)
         self.assertEqual("ESP", importer.parameters["format"])
 
+    def test_importing_esp_data_converts_to_native_byte_order(self):
+        importer = cwepr.io.esp_winepr.ESPWinEPRImporter()
+        importer.source = self.sources[0]
+        self.dataset.import_from(importer)
+        self.assertTrue(self.dataset.data.data.dtype.isnative)
+        np.testing.assert_array_equal(
+            np.fromfile(self.sources[0] + ".spc", ">i4"),
+            self.dataset.data.data.ravel(),
+        )
+
     def test_importing_winepr_data_sets_type_parameter(self):
         importer = cwepr.io.esp_winepr.ESPWinEPRImporter()
         importer.source = self.sources[1]
@@ -94,6 +109,36 @@ class TestESPWinEPRImporter(unittest.TestCase):
         self.dataset.import_from(importer)
         self.assertTrue(len(importer._par_dict.keys()) > 1)
 
+    def test_import_parses_parameter_file_only_once(self):
+        with mock.patch.object(
+            cwepr.io.esp_winepr.ESPWinEPRImporter,
+            "_parse_parameter_file",
+            wraps=cwepr.io.esp_winepr.ESPWinEPRImporter._parse_parameter_file,
+        ) as parse_parameter_file:
+            for _ in range(2):
+                importer = cwepr.io.esp_winepr.ESPWinEPRImporter()
+                importer.source = self.sources[0]
+                cwepr.dataset.ExperimentalDataset().import_from(importer)
+        parse_parameter_file.assert_called_once()
+        self.assertIn("RES", importer._par_dict)
+
+    def test_import_reparses_changed_parameter_file(self):
+        with tempfile.TemporaryDirectory() as testdir:
+            new_source = os.path.join(testdir, "test")
+            for extension in (".par", ".spc"):
+                shutil.copyfile(
+                    self.sources[0] + extension, new_source + extension
+                )
+            importer = cwepr.io.esp_winepr.ESPWinEPRImporter()
+            importer.source = new_source
+            importer._read_parameter_file()
+            with open(new_source + ".par", "a", encoding="ascii") as file:
+                file.write("FOO bar\r")
+            importer = cwepr.io.esp_winepr.ESPWinEPRImporter()
+            importer.source = new_source
+            importer._read_parameter_file()
+            self.assertEqual("bar", importer._par_dict["FOO"])
+
     def test_infofile_gets_imported(self):
         importer = cwepr.io.esp_winepr.ESPWinEPRImporter()
         importer.source = self.sources[0]
@@ -1,10 +1,47 @@
-import collections
 import os
+import tempfile
 import unittest
+
+import numpy as np
+
 import cwepr.io.exporter
 import cwepr.dataset
 
 
+class TestASCIIExporter(unittest.TestCase):
+    def setUp(self):
+        self.exporter = cwepr.io.exporter.ASCIIExporter()
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_ndarrays_to_list_converts_arrays_to_lists(self):
+        dictionary = {"foo": np.zeros(3), "bar": {"baz": np.ones(2)}}
+        dictionary = self.exporter._ndarrays_to_list_recursively(dictionary)
+        self.assertEqual([0.0, 0.0, 0.0], dictionary["foo"])
+        self.assertEqual([1.0, 1.0], dictionary["bar"]["baz"])
+
+    def test_export_writes_data_recoverable_exactly(self):
+        dataset = cwepr.dataset.ExperimentalDataset()
+        dataset.data.data = np.random.random(5)
+        with tempfile.TemporaryDirectory() as testdir:
+            self.exporter.target = os.path.join(testdir, "test")
+            dataset.export_to(self.exporter)
+            data = np.loadtxt(self.exporter.target + ".txt", delimiter=",")
+        np.testing.assert_array_equal(dataset.data.data, data)
+
+    def test_export_with_number_format(self):
+        dataset = cwepr.dataset.ExperimentalDataset()
+        dataset.data.data = np.asarray([0.5, 1.5])
+        self.exporter.number_format = "%.3f"
+        with tempfile.TemporaryDirectory() as testdir:
+            self.exporter.target = os.path.join(testdir, "test")
+            dataset.export_to(self.exporter)
+            with open(self.exporter.target + ".txt", encoding="utf8") as file:
+                contents = file.read()
+        self.assertEqual("0.500\n1.500\n", contents)
+
+
 class TestMetadataExporter(unittest.TestCase):
     def setUp(self):
         self.export = cwepr.io.exporter.MetadataExporter()
@@ -16,9 +53,7 @@ class TestMetadataExporter(unittest.TestCase):
             os.remove(self.export.filename)
 
     def test_metadata_dict_is_dict(self):
-        self.assertIsInstance(
-            self.export.metadata_dict, collections.OrderedDict
-        )
+        self.assertIsInstance(self.export.metadata_dict, dict)
 
     def test_file_exists_with_default_filename_after_export(self):
         self.export.dataset = self.dataset
@@ -55,6 +55,16 @@ class TestDatasetImporterFactory(unittest.TestCase):
         root_source, _ = os.path.splitext(source)
         self.assertEqual(importer_factory.data_format, "MagnettechXML")
 
+    def test_factory_detects_file_added_after_failed_detection(self):
+        source = os.path.join(ROOTPATH, "testdata", "test-magnettech.xml")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            new_source = os.path.join(tmpdir, "test-magnettech")
+            self.factory.get_importer(source=new_source)
+            self.assertIsNone(self.factory.data_format)
+            shutil.copy(source, tmpdir)
+            self.factory.get_importer(source=new_source)
+            self.assertEqual("MagnettechXML", self.factory.data_format)
+
     def test_with_adf_extension_returns_adf_importer(self):
         source = "test.adf"
         importer = self.factory.get_importer(source=source)
@@ -1,10 +1,10 @@
 import unittest
 import os
+import tempfile
 
 import cwepr.io.niehs
 import cwepr.dataset
 
-
 ROOTPATH = os.path.split(os.path.abspath(__file__))[0]
 
 
@@ -156,3 +156,13 @@ class TestNIEHSExpImporter(unittest.TestCase):
         self.assertTrue(
             self.dataset.annotations[0].annotation.content["comment"]
         )
+
+    def test_extract_data_with_block_file_without_header(self):
+        with tempfile.TemporaryDirectory() as testdir:
+            source = os.path.join(testdir, "test")
+            with open(source + ".exp", "w", encoding="ascii") as file:
+                file.write("[DATA]\n3400 1\n3410 2\n")
+            self.importer.source = source
+            self.dataset.import_from(self.importer)
+        self.assertListEqual([1.0, 2.0], list(self.dataset.data.data))
+        self.assertFalse(self.dataset.annotations)
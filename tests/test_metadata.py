@@ -0,0 +1,118 @@
+"""Tests for metadata."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import aspecd.infofile
+import aspecd.metadata
+
+import cwepr.metadata
+
+ROOTPATH = os.path.split(os.path.abspath(__file__))[0]
+
+
+class TestMetadataMapper(unittest.TestCase):
+    def setUp(self):
+        self.mapper = cwepr.metadata.MetadataMapper()
+        self.mapper.recipe_filename = "cwepr@metadata_mapper_cwepr.yaml"
+        self.mapper.version = "0.1.5"
+        cwepr.metadata.MetadataMapper._mappings_cache.clear()
+
+    def tearDown(self):
+        cwepr.metadata.MetadataMapper._mappings_cache.clear()
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_create_mappings_creates_mappings(self):
+        self.mapper.create_mappings()
+        self.assertTrue(self.mapper.mappings)
+
+    def test_create_mappings_reads_recipe_only_once(self):
+        with mock.patch.object(
+            aspecd.metadata.MetadataMapper,
+            "create_mappings",
+            autospec=True,
+            side_effect=aspecd.metadata.MetadataMapper.create_mappings,
+        ) as create_mappings:
+            self.mapper.create_mappings()
+            mapper = cwepr.metadata.MetadataMapper()
+            mapper.recipe_filename = self.mapper.recipe_filename
+            mapper.version = self.mapper.version
+            mapper.create_mappings()
+        create_mappings.assert_called_once()
+        self.assertTrue(mapper.mappings)
+
+    def test_cached_mappings_are_identical(self):
+        self.mapper.create_mappings()
+        mapper = cwepr.metadata.MetadataMapper()
+        mapper.recipe_filename = self.mapper.recipe_filename
+        mapper.version = self.mapper.version
+        mapper.create_mappings()
+        self.assertEqual(self.mapper.mappings, mapper.mappings)
+
+
+class TestInfofile(unittest.TestCase):
+    def setUp(self):
+        self.filename = os.path.join(
+            ROOTPATH, "io/testdata/BDPA-1DFieldSweep.info"
+        )
+        self.infofile = cwepr.metadata.Infofile(filename=self.filename)
+        cwepr.metadata.Infofile._contents_cache.clear()
+
+    def tearDown(self):
+        cwepr.metadata.Infofile._contents_cache.clear()
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_parse_parses_infofile(self):
+        self.infofile.parse()
+        self.assertTrue(self.infofile.parameters)
+        self.assertTrue(self.infofile.infofile_info["version"])
+
+    def test_parse_parses_file_only_once(self):
+        with mock.patch.object(
+            aspecd.infofile.Infofile,
+            "parse",
+            autospec=True,
+            side_effect=aspecd.infofile.Infofile.parse,
+        ) as parse:
+            self.infofile.parse()
+            infofile = cwepr.metadata.Infofile(filename=self.filename)
+            infofile.parse()
+        parse.assert_called_once()
+        self.assertTrue(infofile.parameters)
+
+    def test_cached_contents_are_equal(self):
+        self.infofile.parse()
+        infofile = cwepr.metadata.Infofile(filename=self.filename)
+        infofile.parse()
+        self.assertEqual(self.infofile.parameters, infofile.parameters)
+        self.assertEqual(self.infofile.infofile_info, infofile.infofile_info)
+
+    def test_modifying_parameters_does_not_modify_cache(self):
+        self.infofile.parse()
+        self.infofile.parameters.clear()
+        infofile = cwepr.metadata.Infofile(filename=self.filename)
+        infofile.parse()
+        self.assertTrue(infofile.parameters)
+
+    def test_parse_reparses_changed_infofile(self):
+        with tempfile.TemporaryDirectory() as testdir:
+            filename = os.path.join(testdir, "test.info")
+            shutil.copyfile(self.filename, filename)
+            infofile = cwepr.metadata.Infofile(filename=filename)
+            infofile.parse()
+            with open(filename, encoding="utf8") as file:
+                contents = file.read()
+            with open(filename, "w", encoding="utf8") as file:
+                file.write(contents.replace("298 K", "300.5 K"))
+            infofile = cwepr.metadata.Infofile(filename=filename)
+            infofile.parse()
+            self.assertEqual(
+                "300.5 K", infofile.parameters["TEMPERATURE"]["Temperature"]
+            )
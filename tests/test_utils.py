@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -52,3 +55,131 @@ class TestNotZero(unittest.TestCase):
         self.assertEqual(
             -np.finfo(np.float64).resolution, utils.not_zero(-1e-20)
         )
+
+    def test_not_zero_of_array_returns_array_without_zeros(self):
+        values = np.asarray([-1.0, 0.0, 1e-20, 1.0])
+        self.assertTrue(np.all(utils.not_zero(values)))
+
+    def test_not_zero_of_array_preserves_sign(self):
+        values = np.asarray([-1e-20, 1e-20])
+        np.testing.assert_array_equal(
+            np.sign(values), np.sign(utils.not_zero(values))
+        )
+
+
+class TestParsedFileCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = utils.ParsedFileCache()
+        self.parser = mock.Mock(side_effect=lambda filename: filename)
+        self.testdir = tempfile.TemporaryDirectory()
+        self.filenames = []
+        for number in range(3):
+            filename = os.path.join(self.testdir.name, f"test{number}.txt")
+            with open(filename, "w", encoding="utf8") as file:
+                file.write("foo")
+            self.filenames.append(filename)
+
+    def tearDown(self):
+        self.testdir.cleanup()
+
+    def test_instantiate_class(self):
+        pass
+
+    def test_get_returns_parsed_contents(self):
+        contents = self.cache.get(self.filenames[0], self.parser)
+        self.assertEqual(self.filenames[0], contents)
+
+    def test_get_parses_file_only_once(self):
+        self.cache.get(self.filenames[0], self.parser)
+        self.cache.get(self.filenames[0], self.parser)
+        self.parser.assert_called_once_with(self.filenames[0])
+
+    def test_get_with_relative_filename_uses_same_entry(self):
+        self.cache.get(self.filenames[0], self.parser)
+        self.cache.get(os.path.relpath(self.filenames[0]), self.parser)
+        self.parser.assert_called_once()
+
+    def test_get_reparses_changed_file(self):
+        self.cache.get(self.filenames[0], self.parser)
+        with open(self.filenames[0], "a", encoding="utf8") as file:
+            file.write("bar")
+        self.cache.get(self.filenames[0], self.parser)
+        self.assertEqual(2, self.parser.call_count)
+
+    def test_get_with_missing_file_raises(self):
+        with self.assertRaises(OSError):
+            self.cache.get(self.filenames[0] + ".foo", self.parser)
+
+    def test_cache_keeps_at_most_maxsize_files(self):
+        self.cache.maxsize = 2
+        for filename in self.filenames:
+            self.cache.get(filename, self.parser)
+        self.assertEqual(2, len(self.cache))
+        self.assertNotIn(self.filenames[0], self.cache)
+
+    def test_cache_removes_least_recently_used_file(self):
+        self.cache.maxsize = 2
+        self.cache.get(self.filenames[0], self.parser)
+        self.cache.get(self.filenames[1], self.parser)
+        self.cache.get(self.filenames[0], self.parser)
+        self.cache.get(self.filenames[2], self.parser)
+        self.assertIn(self.filenames[0], self.cache)
+        self.assertNotIn(self.filenames[1], self.cache)
+
+    def test_clear_removes_all_files(self):
+        self.cache.get(self.filenames[0], self.parser)
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+
+
+class TestReadBinaryFile(unittest.TestCase):
+    def setUp(self):
+        self.testdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.testdir.name, "test.dat")
+        self.data = np.linspace(-1, 1, 11)
+
+    def tearDown(self):
+        self.testdir.cleanup()
+
+    def test_read_binary_file_returns_data(self):
+        self.data.astype("<f8").tofile(self.filename)
+        data = utils.read_binary_file(self.filename, dtype="<f8")
+        np.testing.assert_array_equal(self.data, data)
+
+    def test_read_binary_file_returns_native_byte_order(self):
+        for dtype in (">f8", "<f8"):
+            with self.subTest(dtype=dtype):
+                self.data.astype(dtype).tofile(self.filename)
+                data = utils.read_binary_file(self.filename, dtype=dtype)
+                np.testing.assert_array_equal(self.data, data)
+                self.assertTrue(data.dtype.isnative)
+
+    def test_read_binary_file_with_short_read_raises(self):
+        self.data.astype("<f8").tofile(self.filename)
+        with mock.patch("os.path.getsize", return_value=self.data.nbytes * 2):
+            with self.assertRaises(EOFError):
+                utils.read_binary_file(self.filename, dtype="<f8")
+
+
+class TestReadYamlFile(unittest.TestCase):
+    def setUp(self):
+        self.testdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.testdir.name, "test.yaml")
+        with open(self.filename, "w", encoding="utf8") as file:
+            file.write("foo: bar\n")
+
+    def tearDown(self):
+        self.testdir.cleanup()
+
+    def test_read_yaml_file_returns_contents(self):
+        self.assertDictEqual(
+            {"foo": "bar"}, utils.read_yaml_file(self.filename)
+        )
+
+    def test_read_yaml_file_parses_file_only_once(self):
+        with mock.patch(
+            "aspecd.utils.Yaml.read_from", autospec=True
+        ) as read_from:
+            utils.read_yaml_file(self.filename)
+            utils.read_yaml_file(self.filename)
+        read_from.assert_called_once()